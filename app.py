@@ -3,28 +3,117 @@ Web-based Terminal Interface
 A Flask web application for the Python terminal
 """
 
-from flask import Flask, render_template, request, jsonify
+from flask import Flask, render_template, request, jsonify, Response, stream_with_context
 from terminal import PythonTerminal
+from delta import output_id, diff_lines
+from collections import OrderedDict
 import threading
 import time
+import json
+import gzip
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
 
 app = Flask(__name__)
 terminal = PythonTerminal()
 
+# Responses smaller than this are sent uncompressed
+COMPRESS_MIN_SIZE = 512
+# Last output per (session, command) kept for delta mode
+DELTA_CACHE_SIZE = 256
+# Total characters of output the delta cache may hold
+DELTA_CACHE_BYTES = 16 * 1024 * 1024
+# Outputs longer than this are never cached and always sent in full
+DELTA_MAX_OUTPUT = 1024 * 1024
+last_outputs = OrderedDict()
+last_outputs_bytes = 0
+last_outputs_lock = threading.Lock()
+
 @app.route('/')
 def index():
     return render_template('terminal.html')
 
+def remember_output(key, output, current_id):
+    """Store the latest output for key and return the previous (output, output_id)"""
+    global last_outputs_bytes
+    with last_outputs_lock:
+        previous = last_outputs.pop(key, None)
+        if previous is not None:
+            last_outputs_bytes -= len(previous[0])
+        last_outputs[key] = (output, current_id)
+        last_outputs_bytes += len(output)
+        while len(last_outputs) > DELTA_CACHE_SIZE or last_outputs_bytes > DELTA_CACHE_BYTES:
+            _, (evicted, _) = last_outputs.popitem(last=False)
+            last_outputs_bytes -= len(evicted)
+    return previous
+
 @app.route('/execute', methods=['POST'])
 def execute_command():
-    data = request.json
+    data = request.json or {}
     command = data.get('command', '')
-    
+    session = data.get('session', 'default')
+    if not isinstance(command, str) or not isinstance(session, str):
+        return jsonify({'error': "'command' and 'session' must be strings"}), 400
+
     exit_code, output = terminal.run_command(command)
-    
-    return jsonify({
+
+    response = {
         'exit_code': exit_code,
-        'output': output,
+        'prompt': terminal.display_prompt()
+    }
+
+    if data.get('delta') and len(output) <= DELTA_MAX_OUTPUT:
+        current_id = output_id(output)
+        response['output_id'] = current_id
+
+        previous = remember_output((session, command), output, current_id)
+        if previous is not None and data.get('base') == previous[1]:
+            delta = diff_lines(previous[0], output)
+            # Only worth sending when clearly smaller than the output itself
+            if sum(len(line) + 1 for op in delta for line in op[2]) < len(output) // 2:
+                response['delta'] = delta
+                return jsonify(response)
+
+    response['output'] = output
+    return jsonify(response)
+
+@app.route('/batch', methods=['POST'])
+def execute_batch():
+    data = request.json or {}
+    commands = data.get('commands')
+    if commands is None:
+        commands = data.get('script', '')
+
+    if not isinstance(commands, str) and not (
+        isinstance(commands, list) and all(isinstance(command, str) for command in commands)
+    ):
+        return jsonify({'error': "'commands' must be a list of strings or 'script' a string"}), 400
+
+    results = terminal.iter_script(commands)
+
+    if data.get('stream'):
+        def generate():
+            for command, exit_code, output in results:
+                yield json.dumps({
+                    'command': command,
+                    'exit_code': exit_code,
+                    'output': output
+                }) + '\n'
+            yield json.dumps({'prompt': terminal.display_prompt()}) + '\n'
+
+        return Response(stream_with_context(generate()), mimetype='application/x-ndjson')
+
+    results = [
+        {'command': command, 'exit_code': exit_code, 'output': output}
+        for command, exit_code, output in results
+    ]
+
+    return jsonify({
+        'exit_code': results[-1]['exit_code'] if results else 0,
+        'results': results,
         'prompt': terminal.display_prompt()
     })
 
@@ -35,5 +124,25 @@ def status():
         'prompt': terminal.display_prompt()
     })
 
+@app.after_request
+def compress_response(response):
+    if response.direct_passthrough or response.is_streamed or 'Content-Encoding' in response.headers:
+        return response
+
+    response.vary.add('Accept-Encoding')
+    data = response.get_data()
+    if len(data) < COMPRESS_MIN_SIZE:
+        return response
+
+    encoding = request.accept_encodings.best_match(['zstd', 'gzip'] if zstandard is not None else ['gzip'])
+    if encoding == 'zstd':
+        response.set_data(zstandard.ZstdCompressor().compress(data))
+        response.headers['Content-Encoding'] = 'zstd'
+    elif encoding == 'gzip':
+        response.set_data(gzip.compress(data, compresslevel=6))
+        response.headers['Content-Encoding'] = 'gzip'
+
+    return response
+
 if __name__ == '__main__':
     app.run(debug=True, host='0.0.0.0', port=5000)
\ No newline at end of file
@@ -0,0 +1 @@
+# Keeps the project root importable when running plain `pytest`
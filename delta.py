@@ -0,0 +1,43 @@
+"""
+Line-level deltas for terminal output
+Used by the web interface to send only what changed between two outputs
+"""
+
+import hashlib
+
+
+def output_id(output):
+    """Short fingerprint identifying an output string"""
+    return hashlib.sha1(output.encode('utf-8')).hexdigest()[:16]
+
+
+def diff_lines(old, new):
+    """Return replace operations [start, end, lines] turning old into new
+
+    Only the common leading and trailing lines are kept, so the result is at
+    most one operation and takes linear time however repetitive the output is.
+    """
+    old_lines = old.split('\n')
+    new_lines = new.split('\n')
+
+    limit = min(len(old_lines), len(new_lines))
+    prefix = 0
+    while prefix < limit and old_lines[prefix] == new_lines[prefix]:
+        prefix += 1
+
+    limit -= prefix
+    suffix = 0
+    while suffix < limit and old_lines[-1 - suffix] == new_lines[-1 - suffix]:
+        suffix += 1
+
+    if prefix == len(old_lines) == len(new_lines):
+        return []
+    return [[prefix, len(old_lines) - suffix, new_lines[prefix:len(new_lines) - suffix]]]
+
+
+def apply_delta(old, ops):
+    """Apply operations from diff_lines to old and return the new output"""
+    lines = old.split('\n')
+    for start, end, replacement in reversed(ops):
+        lines[start:end] = replacement
+    return '\n'.join(lines)
@@ -21,19 +21,26 @@ import threading
 import queue
 
 class PythonTerminal:
+    MAX_SOURCE_DEPTH = 16
+
     def __init__(self):
         self.current_directory = os.getcwd()
         self.command_history = []
         self.environment_vars = dict(os.environ)
         self.running = True
         self.processes = {}
+        self.hostname = platform.node()
+        self.source_depth = 0
+        self._prompt_cache = (None, None)
         
     def display_prompt(self):
-        """Display the terminal prompt"""
-        user = os.getenv('USER', 'user')
-        hostname = platform.node()
-        current_dir = os.path.basename(self.current_directory) or '/'
-        return f"{user}@{hostname}:{current_dir}$ "
+        """Display the terminal prompt, re-rendered only when cwd or user changes"""
+        user = self.environment_vars.get('USER', 'user')
+        key = (self.current_directory, user)
+        if self._prompt_cache[0] != key:
+            current_dir = os.path.basename(self.current_directory) or '/'
+            self._prompt_cache = (key, f"{user}@{self.hostname}:{current_dir}$ ")
+        return self._prompt_cache[1]
     
     def parse_command(self, command_line):
         """Parse command line into command and arguments"""
@@ -41,6 +48,85 @@ class PythonTerminal:
             return shlex.split(command_line)
         except ValueError as e:
             return None
+
+    def split_chain(self, command_line):
+        """Split a line on unquoted &&, || and ; into (operator, command) pairs, or None on a syntax error"""
+        chain = []
+        current = []
+        operator = ';'
+        quote = None
+        i = 0
+        while i < len(command_line):
+            char = command_line[i]
+            if quote:
+                if char == quote:
+                    quote = None
+                elif char == '\\' and quote == '"' and i + 1 < len(command_line):
+                    current.append(char)
+                    i += 1
+                    char = command_line[i]
+                current.append(char)
+            elif char in ('"', "'"):
+                quote = char
+                current.append(char)
+            elif char == '\\' and i + 1 < len(command_line):
+                current.append(command_line[i:i + 2])
+                i += 1
+            elif command_line.startswith('&&', i) or command_line.startswith('||', i) or char == ';':
+                command = ''.join(current).strip()
+                if not command:
+                    return None
+                chain.append((operator, command))
+                operator = ';' if char == ';' else command_line[i:i + 2]
+                i += len(operator)
+                if command_line[i:i + 1] in ('&', '|', ';'):
+                    return None
+                current = []
+                continue
+            else:
+                current.append(char)
+            i += 1
+        if quote:
+            return None
+        command = ''.join(current).strip()
+        if command:
+            chain.append((operator, command))
+        elif operator != ';':
+            return None
+        return chain
+
+    def iter_script(self, lines):
+        """Run script lines in order, yielding (command, exit_code, output) for each command executed"""
+        if isinstance(lines, str):
+            lines = lines.splitlines()
+
+        last_exit = 0
+        for line in lines:
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            chain = self.split_chain(line)
+            if chain is None:
+                last_exit = 1
+                yield line, last_exit, "Syntax error in command"
+                continue
+            for operator, command_line in chain:
+                if operator == '&&' and last_exit != 0:
+                    continue
+                if operator == '||' and last_exit == 0:
+                    continue
+                # cmd_exit clears running, so reset it to spot exit in this command
+                running = self.running
+                self.running = True
+                last_exit, output = self.run_command(command_line)
+                yield command_line, last_exit, output
+                if not self.running:
+                    return
+                self.running = running
+
+    def run_script(self, lines):
+        """Run script lines and return a list of (command, exit_code, output) results"""
+        return list(self.iter_script(lines))
     
     def execute_builtin(self, command, args):
         """Execute built-in commands"""
@@ -98,6 +184,8 @@ class PythonTerminal:
             return self.cmd_head(args)
         elif command == 'tail':
             return self.cmd_tail(args)
+        elif command in ('source', '.'):
+            return self.cmd_source(args)
         else:
             return None
 
@@ -548,6 +636,41 @@ class PythonTerminal:
 
         return 0, '\n'.join(results)
 
+    def cmd_source(self, args):
+        if not args:
+            return 1, "source: filename argument required"
+
+        if self.source_depth >= self.MAX_SOURCE_DEPTH:
+            return 1, "source: maximum nesting depth exceeded"
+
+        file_path = args[0]
+        full_path = os.path.join(self.current_directory, file_path) if not os.path.isabs(file_path) else file_path
+        try:
+            with open(full_path, 'r') as f:
+                lines = f.read().splitlines()
+        except FileNotFoundError:
+            return 1, f"source: {file_path}: No such file or directory"
+        except PermissionError:
+            return 1, f"source: {file_path}: Permission denied"
+        except IsADirectoryError:
+            return 1, f"source: {file_path}: Is a directory"
+        except UnicodeDecodeError:
+            return 1, f"source: {file_path}: Binary file"
+        except OSError as e:
+            return 1, f"source: {file_path}: {str(e)}"
+
+        exit_code = 0
+        output = []
+        self.source_depth += 1
+        try:
+            for _, exit_code, result in self.iter_script(lines):
+                if result:
+                    output.append(result)
+        finally:
+            self.source_depth -= 1
+
+        return exit_code, '\n'.join(output)
+
     def execute_external(self, command, args):
         try:
             full_command = [command] + args
@@ -0,0 +1,160 @@
+import gzip
+import json
+
+import pytest
+
+import app as app_module
+from delta import apply_delta
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    monkeypatch.setattr(app_module.terminal, 'current_directory', str(tmp_path))
+    return app_module.app.test_client()
+
+
+def test_batch_json(client):
+    response = client.post('/batch', json={'commands': ['echo a && cat missing || echo b', 'echo c']})
+    assert response.status_code == 200
+    data = response.get_json()
+    assert [result['command'] for result in data['results']] == ['echo a', 'cat missing', 'echo b', 'echo c']
+    assert data['exit_code'] == 0
+    assert 'prompt' in data
+
+
+def test_batch_ndjson_stream(client):
+    response = client.post('/batch', json={'script': 'echo a\necho b', 'stream': True})
+    assert response.mimetype == 'application/x-ndjson'
+    lines = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+    assert lines[:2] == [
+        {'command': 'echo a', 'exit_code': 0, 'output': 'a'},
+        {'command': 'echo b', 'exit_code': 0, 'output': 'b'},
+    ]
+    assert 'prompt' in lines[-1]
+
+
+def test_batch_after_exit_runs_everything(client):
+    client.post('/execute', json={'command': 'exit'})
+    response = client.post('/batch', json={'script': 'echo a; echo b; echo c'})
+    assert len(response.get_json()['results']) == 3
+
+
+@pytest.mark.parametrize('payload', [
+    {'commands': 5},
+    {'commands': ['echo a', 3]},
+    {'commands': 5, 'stream': True},
+])
+def test_batch_rejects_invalid_payload(client, payload):
+    response = client.post('/batch', json=payload)
+    assert response.status_code == 400
+    assert 'error' in response.get_json()
+
+
+def write_large_file(tmp_path, lines=200):
+    (tmp_path / 'big.txt').write_text('\n'.join(f'line {i}' for i in range(lines)))
+
+
+def test_execute_without_delta_has_no_output_id(client):
+    data = client.post('/execute', json={'command': 'echo hi'}).get_json()
+    assert data['output'] == 'hi'
+    assert 'output_id' not in data
+
+
+def test_execute_delta_mode(client, tmp_path):
+    write_large_file(tmp_path)
+    request = {'command': 'cat big.txt', 'delta': True, 'session': 'test-delta'}
+    first = client.post('/execute', json=request).get_json()
+    assert 'delta' not in first
+
+    (tmp_path / 'big.txt').write_text('\n'.join('changed' if i == 5 else f'line {i}' for i in range(200)))
+    second = client.post('/execute', json=dict(request, base=first['output_id'])).get_json()
+    assert 'output' not in second
+    assert apply_delta(first['output'], second['delta']) == (tmp_path / 'big.txt').read_text()
+
+    third = client.post('/execute', json=dict(request, base='stale')).get_json()
+    assert third['output'] == (tmp_path / 'big.txt').read_text()
+
+
+def test_execute_delta_falls_back_when_not_smaller(client, tmp_path):
+    write_large_file(tmp_path)
+    request = {'command': 'cat big.txt', 'delta': True, 'session': 'test-fallback'}
+    first = client.post('/execute', json=request).get_json()
+
+    (tmp_path / 'big.txt').write_text('\n'.join(f'other {i}' for i in range(200)))
+    second = client.post('/execute', json=dict(request, base=first['output_id'])).get_json()
+    assert 'delta' not in second
+    assert second['output'].startswith('other 0')
+
+
+def test_oversized_output_is_not_cached(client, tmp_path, monkeypatch):
+    monkeypatch.setattr(app_module, 'DELTA_MAX_OUTPUT', 100)
+    write_large_file(tmp_path)
+    data = client.post('/execute', json={'command': 'cat big.txt', 'delta': True, 'session': 'test-oversized'}).get_json()
+    assert 'output_id' not in data
+    assert ('test-oversized', 'cat big.txt') not in app_module.last_outputs
+
+
+def test_delta_cache_is_capped_by_size(monkeypatch):
+    monkeypatch.setattr(app_module, 'last_outputs', app_module.OrderedDict())
+    monkeypatch.setattr(app_module, 'last_outputs_bytes', 0)
+    monkeypatch.setattr(app_module, 'DELTA_CACHE_BYTES', 25)
+    for i in range(5):
+        app_module.remember_output(('s', str(i)), 'x' * 10, str(i))
+    assert list(app_module.last_outputs) == [('s', '3'), ('s', '4')]
+    assert app_module.last_outputs_bytes == 20
+
+
+@pytest.mark.parametrize('payload', [
+    {'command': 'echo a', 'session': []},
+    {'command': 'echo a', 'session': {}, 'delta': True},
+    {'command': ['echo', 'a']},
+])
+def test_execute_rejects_invalid_payload(client, payload):
+    response = client.post('/execute', json=payload)
+    assert response.status_code == 400
+    assert 'error' in response.get_json()
+
+
+def test_large_response_is_gzipped(client, tmp_path):
+    write_large_file(tmp_path)
+    response = client.post('/execute', json={'command': 'cat big.txt'}, headers={'Accept-Encoding': 'gzip'})
+    assert response.headers['Content-Encoding'] == 'gzip'
+    assert 'Accept-Encoding' in response.headers['Vary']
+    assert json.loads(gzip.decompress(response.data))['output'].startswith('line 0')
+
+
+def test_small_response_is_not_compressed(client):
+    response = client.post('/execute', json={'command': 'echo hi'}, headers={'Accept-Encoding': 'gzip'})
+    assert 'Content-Encoding' not in response.headers
+    assert 'Accept-Encoding' in response.headers['Vary']
+
+
+def test_response_without_accept_encoding_is_not_compressed(client, tmp_path):
+    write_large_file(tmp_path)
+    response = client.post('/execute', json={'command': 'cat big.txt'})
+    assert 'Content-Encoding' not in response.headers
+
+
+def test_streamed_response_is_not_compressed(client, tmp_path):
+    write_large_file(tmp_path)
+    response = client.post('/batch', json={'script': 'cat big.txt', 'stream': True},
+                           headers={'Accept-Encoding': 'gzip'})
+    assert 'Content-Encoding' not in response.headers
+    assert json.loads(response.get_data(as_text=True).splitlines()[0])['output'].startswith('line 0')
+
+
+class FakeZstandard:
+    class ZstdCompressor:
+        def compress(self, data):
+            return b'zstd' + data
+
+
+@pytest.mark.parametrize('accept, expected', [
+    ('zstd, gzip', 'zstd'),
+    ('zstd;q=0.1, gzip', 'gzip'),
+])
+def test_encoding_follows_client_preference(client, tmp_path, monkeypatch, accept, expected):
+    monkeypatch.setattr(app_module, 'zstandard', FakeZstandard)
+    write_large_file(tmp_path)
+    response = client.post('/execute', json={'command': 'cat big.txt'}, headers={'Accept-Encoding': accept})
+    assert response.headers['Content-Encoding'] == expected
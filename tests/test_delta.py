@@ -0,0 +1,40 @@
+import time
+
+import pytest
+
+from delta import apply_delta, diff_lines, output_id
+
+
+@pytest.mark.parametrize('old, new', [
+    ('', ''),
+    ('', 'a\nb'),
+    ('a\nb', ''),
+    ('a\nb\n', 'a\nb'),
+    ('a\nb', 'a\nb\n'),
+    ('a\nb\nc', 'x\na\nb\nc\ny'),
+    ('a\nb\nc\nd', 'a\nd'),
+    ('a\nb\nc', 'a\nB\nc'),
+])
+def test_round_trip(old, new):
+    assert apply_delta(old, diff_lines(old, new)) == new
+
+
+def test_identical_output_has_no_ops():
+    assert diff_lines('a\nb', 'a\nb') == []
+
+
+def test_output_id_is_stable():
+    assert output_id('a\nb') == output_id('a\nb')
+    assert output_id('a\nb') != output_id('a\nb\n')
+
+
+@pytest.mark.parametrize('old, new', [
+    ('\n'.join('' if i % 2 else f'line {i}' for i in range(1000)),
+     '\n'.join('' if i % 2 else f'line {i + 1}' for i in range(1000))),
+    ('\n'.join(['same'] * 20000), '\n'.join(['same'] * 10000 + ['other'] + ['same'] * 10000)),
+])
+def test_repetitive_output_diffs_quickly(old, new):
+    start = time.perf_counter()
+    ops = diff_lines(old, new)
+    assert time.perf_counter() - start < 0.5
+    assert apply_delta(old, ops) == new
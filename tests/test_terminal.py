@@ -0,0 +1,117 @@
+import pytest
+
+from terminal import PythonTerminal
+
+
+def make_terminal(tmp_path):
+    terminal = PythonTerminal()
+    terminal.current_directory = str(tmp_path)
+    return terminal
+
+
+def test_split_chain_ignores_quoted_operators(tmp_path):
+    terminal = make_terminal(tmp_path)
+    assert terminal.split_chain('echo "a && b; c" && echo \'d || e\'') == [
+        (';', 'echo "a && b; c"'),
+        ('&&', "echo 'd || e'"),
+    ]
+
+
+def test_split_chain_ignores_escaped_semicolon(tmp_path):
+    terminal = make_terminal(tmp_path)
+    assert terminal.split_chain(r'echo a\; b; echo c') == [
+        (';', r'echo a\; b'),
+        (';', 'echo c'),
+    ]
+
+
+@pytest.mark.parametrize('line', [
+    '&& echo a',
+    'echo a &&',
+    'echo a ||',
+    'echo a|||b',
+    'echo a &&& echo b',
+    'echo a ;; echo b',
+    'echo a; && echo b',
+    '; echo a',
+    'echo "a && b',
+])
+def test_split_chain_rejects_malformed_chains(tmp_path, line):
+    terminal = make_terminal(tmp_path)
+    assert terminal.split_chain(line) is None
+    assert terminal.run_script([line, 'echo ok']) == [
+        (line, 1, 'Syntax error in command'),
+        ('echo ok', 0, 'ok'),
+    ]
+
+
+def test_split_chain_allows_trailing_semicolon(tmp_path):
+    terminal = make_terminal(tmp_path)
+    assert terminal.split_chain('echo a;') == [(';', 'echo a')]
+
+
+def test_chain_semantics(tmp_path):
+    terminal = make_terminal(tmp_path)
+    results = terminal.run_script(['cat missing && echo a || echo b'])
+    assert [command for command, _, _ in results] == ['cat missing', 'echo b']
+    assert results[-1][1:] == (0, 'b')
+
+
+def test_comments_and_blank_lines_are_skipped(tmp_path):
+    terminal = make_terminal(tmp_path)
+    results = terminal.run_script('# comment\n\n   \necho a\n  # another\necho b')
+    assert results == [('echo a', 0, 'a'), ('echo b', 0, 'b')]
+
+
+def test_exit_stops_script_but_not_later_scripts(tmp_path):
+    terminal = make_terminal(tmp_path)
+    assert terminal.run_script('echo a; exit; echo b') == [('echo a', 0, 'a'), ('exit', 0, 'Goodbye!')]
+    assert len(terminal.run_script('echo a; echo b; echo c')) == 3
+
+
+def test_exit_inside_script_clears_running(tmp_path):
+    terminal = make_terminal(tmp_path)
+    terminal.run_script('exit')
+    assert not terminal.running
+    assert len(terminal.run_script('echo a; echo b')) == 2
+    assert not terminal.running
+
+
+def test_source_runs_script(tmp_path):
+    terminal = make_terminal(tmp_path)
+    (tmp_path / 's.sh').write_text('echo one\ncat missing || echo two\n')
+    assert terminal.run_command('source s.sh') == (0, 'one\ncat: missing: No such file or directory\ntwo')
+
+
+def test_source_recursion_is_limited(tmp_path):
+    terminal = make_terminal(tmp_path)
+    (tmp_path / 'a.sh').write_text('source b.sh\n')
+    (tmp_path / 'b.sh').write_text('source a.sh\n')
+    exit_code, output = terminal.run_command('source a.sh')
+    assert exit_code == 1
+    assert output == 'source: maximum nesting depth exceeded'
+    assert terminal.source_depth == 0
+
+
+def test_source_depth_checked_before_reading(tmp_path, monkeypatch):
+    terminal = make_terminal(tmp_path)
+    terminal.source_depth = terminal.MAX_SOURCE_DEPTH
+    monkeypatch.setattr('builtins.open', lambda *args, **kwargs: pytest.fail('source read a file'))
+    assert terminal.run_command('source a.sh') == (1, 'source: maximum nesting depth exceeded')
+
+
+def test_source_errors(tmp_path):
+    terminal = make_terminal(tmp_path)
+    (tmp_path / 'binary').write_bytes(b'\xff\xfe\x00\x81')
+    assert terminal.run_command('source') == (1, 'source: filename argument required')
+    assert terminal.run_command('source missing') == (1, 'source: missing: No such file or directory')
+    assert terminal.run_command('source .') == (1, 'source: .: Is a directory')
+    assert terminal.run_command('source binary') == (1, 'source: binary: Binary file')
+
+
+def test_prompt_follows_directory(tmp_path):
+    terminal = make_terminal(tmp_path)
+    assert terminal.display_prompt().endswith(f':{tmp_path.name}$ ')
+    (tmp_path / 'sub').mkdir()
+    terminal.current_directory = str(tmp_path / 'sub')
+    assert terminal.display_prompt().endswith(':sub$ ')